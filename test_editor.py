@@ -4,6 +4,14 @@ import tkinter as tk
 from tkinter import Text, filedialog, messagebox, simpledialog, font
 import re
 
+try:
+    from re2 import compile as _compile_re
+except ImportError:
+    def _compile_re(pattern):
+        # RE2's \b only recognises ASCII word characters; do the same here so
+        # highlighting doesn't depend on whether re2 is installed.
+        return re.compile(pattern, re.ASCII)
+
 class TextEditor:
     """
     A class that represents the text editor application.
@@ -30,9 +38,10 @@ class TextEditor:
         redo_text(): Redoes the last undone action.
         choose_font(): Changes the font of the text area.
         toggle_dark_mode(): Toggles between dark mode and light mode.
-        on_key_release(event=None): Updates line numbers, highlights syntax, and updates status bar on key release.
+        on_key_release(event=None): Schedules a refresh of line numbers, syntax highlighting, and status bar on key release.
         update_line_numbers(event=None): Updates the line numbers in the line numbers widget.
-        highlight_syntax(): Highlights syntax for keywords.
+        on_view_change(*args): Re-highlights syntax once the visible area of the text changes.
+        highlight_syntax(): Highlights syntax for keywords in the visible area of the text.
     """
     def __init__(self, root):
         """
@@ -44,9 +53,6 @@ class TextEditor:
         self.root = root
         self.root.title("Text Editor")
         self.root.geometry("800x600")
-        
-        self.root.title("Text Editor")
-        self.root.geometry("800x600")
 
         self.text_area = Text(self.root, wrap='word', font=("Calibri", 12), undo=True)
         self.text_area.pack(fill='both', expand=1)
@@ -59,9 +65,32 @@ class TextEditor:
         self.status_bar = tk.Label(self.root, text="Line 1, Column 1", anchor='w')
         self.status_bar.pack(side='bottom', fill='x')
 
+        self._last_lines = 0
+        self._pending = None
+        self._highlight_job = None
+        self._loader = None
+        self._load_job = None
+        self._status_text = None
         self.text_area.bind('<KeyRelease>', self.on_key_release)
         self.text_area.bind('<Button-1>', self.update_status_bar)
-        self.text_area.bind('<Motion>', self.update_status_bar)
+        self.text_area.bind('<ButtonRelease-1>', self.update_status_bar)
+        self.text_area.bind('<<Selection>>', self.update_status_bar)
+        self.text_area.config(yscrollcommand=self.on_view_change)
+
+        keywords = ['def', 'class', 'if', 'else', 'elif', 'while', 'for', 'import', 'from', 'return']
+        self._kw_re = _compile_re(r'\b(' + '|'.join(map(re.escape, keywords)) + r')\b')
+        # Tcl 8.6 counts characters above U+FFFF as two in index offsets.
+        self._utf16_offsets = self.root.tk.call('string', 'length', '\U0001F600') == 2
+        self.text_area.tag_config('found', foreground='red', background='yellow')
+        self.text_area.tag_config('keyword', foreground='blue')
+
+        self._dark = False
+        self._themes = {
+            False: {'text': {'background': 'white', 'foreground': 'black', 'insertbackground': 'black'},
+                    'ln': {'background': 'lightgrey', 'foreground': 'black'}},
+            True: {'text': {'background': 'black', 'foreground': 'white', 'insertbackground': 'white'},
+                   'ln': {'background': 'black', 'foreground': 'white'}},
+        }
 
         self.create_menu()
         self.update_status_bar()
@@ -70,31 +99,64 @@ class TextEditor:
         """
         Updates the status bar with the current line and column number.
 
+        The label is only reconfigured when the position has changed.
+
         Args:
             event (tk.Event, optional): The event that triggered the update. Defaults to None.
         """
         row, col = self.text_area.index(tk.INSERT).split('.')
-        self.status_bar.config(text=f"Line {row}, Column {col}")
+        status_text = f"Line {row}, Column {col}"
+        if status_text != self._status_text:
+            self._status_text = status_text
+            self.status_bar.config(text=status_text)
 
     def create_menu(self):
         """
         Creates the menu bar with File, Edit, Format, and View menus.
+
+        Each menu is left empty and filled in the first time it is opened.
         """
         menu_bar = tk.Menu(self.root)
         self.root.config(menu=menu_bar)
 
         file_menu = tk.Menu(menu_bar, tearoff=0)
+        file_menu.config(postcommand=lambda m=file_menu: self._populate_file_menu(m))
         menu_bar.add_cascade(label="File", menu=file_menu)
-        
+
+        edit_menu = tk.Menu(menu_bar, tearoff=0)
+        edit_menu.config(postcommand=lambda m=edit_menu: self._populate_edit_menu(m))
+        menu_bar.add_cascade(label="Edit", menu=edit_menu)
+
+        format_menu = tk.Menu(menu_bar, tearoff=0)
+        format_menu.config(postcommand=lambda m=format_menu: self._populate_format_menu(m))
+        menu_bar.add_cascade(label="Format", menu=format_menu)
+
+        view_menu = tk.Menu(menu_bar, tearoff=0)
+        view_menu.config(postcommand=lambda m=view_menu: self._populate_view_menu(m))
+        menu_bar.add_cascade(label="View", menu=view_menu)
+
+    def _populate_file_menu(self, file_menu):
+        """
+        Adds the commands to the File menu the first time it is opened.
+
+        Args:
+            file_menu (tk.Menu): The File menu.
+        """
+        file_menu.config(postcommand='')
         file_menu.add_command(label="New", command=self.new_file)
         file_menu.add_command(label="Open", command=self.open_file)
         file_menu.add_command(label="Save", command=self.save_file)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.exit_editor)
 
-        edit_menu = tk.Menu(menu_bar, tearoff=0)
-        menu_bar.add_cascade(label="Edit", menu=edit_menu)
-        
+    def _populate_edit_menu(self, edit_menu):
+        """
+        Adds the commands to the Edit menu the first time it is opened.
+
+        Args:
+            edit_menu (tk.Menu): The Edit menu.
+        """
+        edit_menu.config(postcommand='')
         edit_menu.add_command(label="Cut", command=self.cut_text)
         edit_menu.add_command(label="Copy", command=self.copy_text)
         edit_menu.add_command(label="Paste", command=self.paste_text)
@@ -105,14 +167,24 @@ class TextEditor:
         edit_menu.add_command(label="Undo", command=self.undo_text)
         edit_menu.add_command(label="Redo", command=self.redo_text)
 
-        format_menu = tk.Menu(menu_bar, tearoff=0)
-        menu_bar.add_cascade(label="Format", menu=format_menu)
-        
+    def _populate_format_menu(self, format_menu):
+        """
+        Adds the commands to the Format menu the first time it is opened.
+
+        Args:
+            format_menu (tk.Menu): The Format menu.
+        """
+        format_menu.config(postcommand='')
         format_menu.add_command(label="Font", command=self.choose_font)
-        
-        view_menu = tk.Menu(menu_bar, tearoff=0)
-        menu_bar.add_cascade(label="View", menu=view_menu)
-        
+
+    def _populate_view_menu(self, view_menu):
+        """
+        Adds the commands to the View menu the first time it is opened.
+
+        Args:
+            view_menu (tk.Menu): The View menu.
+        """
+        view_menu.config(postcommand='')
         view_menu.add_command(label="Toggle Dark Mode", command=self.toggle_dark_mode)
 
     def cut_text(self):
@@ -137,32 +209,127 @@ class TextEditor:
         """
         Clears the text area for a new file.
         """
+        self._cancel_load()
         self.text_area.delete(1.0, tk.END)
         self.update_status_bar()
 
     def open_file(self):
         """
         Opens a file and displays its content in the text area.
+
+        The file is inserted in chunks from idle callbacks so the UI stays
+        responsive while large files load. The text area is read-only until
+        loading has finished.
         """
         file_path = filedialog.askopenfilename()
         if file_path:
-            with open(file_path, 'r') as file:
-                content = file.read()
-                self.text_area.delete(1.0, tk.END)
-                self.text_area.insert(tk.END, content)
-            self.update_status_bar()
+            file = open(file_path, 'r', encoding='utf-8', errors='replace', buffering=1 << 20)
+            self._cancel_load()
+            self.text_area.delete(1.0, tk.END)
+            self.text_area.config(state='disabled')
+            self._loader = self._read_chunks(file)
+            self._load_next_chunk()
+
+    def _read_chunks(self, file, chunk_size=262144):
+        """
+        Inserts the content of a file into the text area one chunk at a time.
+
+        Args:
+            file (file): The open file to read from. It is closed once exhausted.
+            chunk_size (int, optional): The number of characters per chunk. Defaults to 262144.
+
+        Yields:
+            None: After each chunk has been inserted.
+        """
+        with file:
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    break
+                self.text_area.config(state='normal')
+                self.text_area.insert(tk.END, chunk)
+                self.text_area.config(state='disabled')
+                yield
+
+    def _load_next_chunk(self):
+        """
+        Inserts the next chunk of the file being opened and schedules the following one.
+        """
+        try:
+            next(self._loader)
+        except StopIteration:
+            self._finish_load()
+        except Exception:
+            self._finish_load()
+            raise
+        else:
+            self.root.update_idletasks()
+            self._load_job = self.root.after_idle(self._load_next_chunk)
+
+    def _cancel_load(self):
+        """
+        Stops loading the file being opened, if any.
+        """
+        if self._loader is not None:
+            self.root.after_cancel(self._load_job)
+            self._loader.close()
+            self._loader = None
+            self._load_job = None
+            self.text_area.config(state='normal')
+
+    def _finish_load(self):
+        """
+        Refreshes the editor once a file has been opened.
+        """
+        self._loader = None
+        self._load_job = None
+        self.text_area.config(state='normal')
+        if self._pending:
+            self.root.after_cancel(self._pending)
+        self._do_refresh()
+        self.text_area.edit_modified(False)
 
     def save_file(self):
         """
         Saves the content of the text area to a file.
         """
+        if self._still_loading("Save"):
+            return
         file_path = filedialog.asksaveasfilename(defaultextension=".txt",
                                                  filetypes=[("Text files", "*.txt"),
                                                             ("All files", "*.*")])
         if file_path:
-            with open(file_path, 'w') as file:
-                content = self.text_area.get(1.0, tk.END)
-                file.write(content)
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as file:
+                file.writelines(self._iter_lines())
+
+    def _still_loading(self, title):
+        """
+        Warns the user if a file is still being opened.
+
+        Args:
+            title (str): The title of the warning dialog.
+
+        Returns:
+            bool: True if a file is still loading.
+        """
+        if self._loader is not None:
+            messagebox.showwarning(title, "Please wait until the file has finished loading.")
+            return True
+        return False
+
+    def _iter_lines(self, block_size=1024):
+        """
+        Yields the content of the text area in blocks of lines.
+
+        Args:
+            block_size (int, optional): The number of lines per block. Defaults to 1024.
+
+        Yields:
+            str: The text of the next block of lines, including line endings.
+        """
+        end_row = int(self.text_area.index(tk.END).split('.')[0])
+        for row in range(1, end_row, block_size):
+            yield self.text_area.get(f"{row}.0", f"{row + block_size}.0")
 
     def exit_editor(self):
         """
@@ -175,28 +342,63 @@ class TextEditor:
         """
         Finds and highlights the specified text.
         """
+        if self._still_loading("Find"):
+            return
         find_string = simpledialog.askstring("Find", "Enter text to find:")
         self.text_area.tag_remove('found', '1.0', tk.END)
         if find_string:
-            idx = '1.0'
-            while 1:
-                idx = self.text_area.search(find_string, idx, nocase=1, stopindex=tk.END)
-                if not idx: break
-                lastidx = f"{idx}+{len(find_string)}c"
-                self.text_area.tag_add('found', idx, lastidx)
-                idx = lastidx
-            self.text_area.tag_config('found', foreground='red', background='yellow')
+            ranges = []
+            for start_index, end_index in self._search_all(find_string, nocase=True):
+                ranges += [start_index, end_index]
+            if ranges:
+                self.text_area.tag_add('found', *ranges)
+
+    def _search_all(self, pattern, start='1.0', stop=tk.END, nocase=False):
+        """
+        Finds all matches of a pattern in the text area with a single Tk search call.
+
+        Args:
+            pattern (str): The text to search for.
+            start (str, optional): The index to start searching from. Defaults to '1.0'.
+            stop (str, optional): The index to stop searching at. Defaults to tk.END.
+            nocase (bool, optional): Whether to ignore case. Defaults to False.
+
+        Returns:
+            list: (start, end) index pairs of the matches.
+        """
+        count_var = tk.StringVar(self.root)
+        switches = ['-all', '-count', count_var]
+        if nocase:
+            switches.append('-nocase')
+        tcl = self.text_area.tk
+        indices = tcl.splitlist(tcl.call(self.text_area._w, 'search', *switches,
+                                        '--', pattern, start, stop))
+        counts = tcl.splitlist(count_var.get())
+        return [(str(idx), f"{idx}+{count}c") for idx, count in zip(indices, counts)]
 
     def replace_text(self):
         """
         Replaces the specified text with the replacement text.
+
+        Matches are replaced in place as a single undoable action.
         """
+        if self._still_loading("Replace"):
+            return
         find_string = simpledialog.askstring("Find", "Enter text to replace:")
         replace_string = simpledialog.askstring("Replace", "Enter replacement text:")
-        content = self.text_area.get(1.0, tk.END)
-        new_content = content.replace(find_string, replace_string)
-        self.text_area.delete(1.0, tk.END)
-        self.text_area.insert(1.0, new_content)
+        if not find_string or replace_string is None:
+            return
+        self.text_area.edit_separator()
+        self.text_area.config(autoseparators=False)
+        try:
+            # Replace from the last match backwards so earlier indices stay valid.
+            for start_index, end_index in reversed(self._search_all(find_string)):
+                self.text_area.delete(start_index, end_index)
+                self.text_area.insert(start_index, replace_string)
+        finally:
+            self.text_area.config(autoseparators=True)
+            self.text_area.edit_separator()
+        self.on_key_release()
 
     def undo_text(self):
         """
@@ -230,21 +432,38 @@ class TextEditor:
         """
         Toggles between dark mode and light mode.
         """
-        current_bg = self.text_area.cget('background')
-        if current_bg == 'white':
-            self.text_area.config(background='black', foreground='white', insertbackground='white')
-            self.line_numbers.config(background='black', foreground='white')
-        else:
-            self.text_area.config(background='white', foreground='black', insertbackground='black')
-            self.line_numbers.config(background='lightgrey', foreground='black')
+        self._dark ^= True
+        theme = self._themes[self._dark]
+        self.text_area.config(**theme['text'])
+        self.line_numbers.config(**theme['ln'])
 
     def on_key_release(self, event=None):
         """
-        Updates line numbers, highlights syntax, and updates status bar on key release.
+        Schedules a refresh of line numbers, syntax highlighting, and status bar on key release.
+
+        Nothing is done while a file is loading. Keys that leave the text
+        unchanged, such as arrows and modifiers, only update the status bar.
+        Any refresh that is still pending is cancelled, so a burst of
+        keystrokes results in a single refresh once typing pauses.
 
         Args:
             event (tk.Event, optional): The event that triggered the update. Defaults to None.
         """
+        if self._loader is not None:
+            return
+        if not self.text_area.edit_modified():
+            self.update_status_bar()
+            return
+        self.text_area.edit_modified(False)
+        if self._pending:
+            self.root.after_cancel(self._pending)
+        self._pending = self.root.after(50, self._do_refresh)
+
+    def _do_refresh(self):
+        """
+        Updates line numbers, highlights syntax, and updates status bar.
+        """
+        self._pending = None
         self.update_line_numbers()
         self.highlight_syntax()
         self.update_status_bar()
@@ -253,32 +472,68 @@ class TextEditor:
         """
         Updates the line numbers in the line numbers widget.
 
+        Only the numbers for lines added or removed since the last update are
+        inserted or deleted.
+
         Args:
             event (tk.Event, optional): The event that triggered the update. Defaults to None.
         """
-        self.line_numbers.config(state='normal')
-        self.line_numbers.delete(1.0, tk.END)
         row, col = self.text_area.index(tk.END).split('.')
-        line_numbers = "\n".join(str(i) for i in range(1, int(row)))
-        self.line_numbers.insert(1.0, line_numbers)
+        n = int(row) - 1
+        if n == self._last_lines:
+            return
+        self.line_numbers.config(state='normal')
+        if n > self._last_lines:
+            line_numbers = "\n".join(str(i) for i in range(self._last_lines + 1, n + 1))
+            if self._last_lines:
+                line_numbers = "\n" + line_numbers
+            self.line_numbers.insert(tk.END + "-1c", line_numbers)
+        else:
+            self.line_numbers.delete(f"{n}.end", tk.END)
         self.line_numbers.config(state='disabled')
+        self._last_lines = n
 
-    def highlight_syntax(self):
+    def on_view_change(self, *args):
         """
-        Highlights syntax for keywords.
+        Re-highlights syntax once the visible area of the text changes.
+
+        Used as the text area's yscrollcommand, so it runs for every scroll,
+        resize, or edit that moves the view. At most one re-highlight is
+        pending at a time.
+
+        Args:
+            *args: The visible fractions of the text, passed by Tk.
         """
-        keywords = ['def', 'class', 'if', 'else', 'elif', 'while', 'for', 'import', 'from', 'return']
-        text_content = self.text_area.get(1.0, tk.END)
-        for keyword in keywords:
-            start_index = '1.0'
-            while True:
-                start_index = self.text_area.search(r'\b' + keyword + r'\b', start_index, stopindex=tk.END)
-                if not start_index:
-                    break
-                end_index = f"{start_index}+{len(keyword)}c"
-                self.text_area.tag_add(keyword, start_index, end_index)
-                self.text_area.tag_config(keyword, foreground='blue')
-                start_index = end_index
+        if self._loader is None and self._highlight_job is None:
+            self._highlight_job = self.root.after_idle(self._do_highlight)
+
+    def _do_highlight(self):
+        """
+        Runs the re-highlight scheduled by on_view_change.
+        """
+        self._highlight_job = None
+        self.highlight_syntax()
+
+    def highlight_syntax(self):
+        """
+        Highlights syntax for keywords in the visible area of the text.
+        """
+        top = self.text_area.index('@0,0 linestart')
+        bottom = self.text_area.index(f'@0,{self.text_area.winfo_height()} lineend')
+        text_content = self.text_area.get(top, bottom)
+        self.text_area.tag_remove('keyword', top, bottom)
+        ranges = []
+        position = offset = 0
+        for match in self._kw_re.finditer(text_content):
+            start, end = match.span()
+            if self._utf16_offsets:
+                offset += len(text_content[position:start].encode('utf-16-le')) // 2
+            else:
+                offset += start - position
+            ranges += [f"{top}+{offset}c", f"{top}+{offset + end - start}c"]
+            position, offset = end, offset + end - start
+        if ranges:
+            self.text_area.tag_add('keyword', *ranges)
 
 if __name__ == "__main__":
     root = tk.Tk()